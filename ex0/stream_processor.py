@@ -1,8 +1,14 @@
+import re
 from abc import ABC, abstractmethod
 from typing import Any, List
 
+_WORD_RE = re.compile(r"\S+")
+_LEVELS = {"ERROR": "ALERT", "INFO": "INFO"}
+
 
 class DataProcessor(ABC):
+    _PREFIX = "Result: "
+
     @abstractmethod
     def process(self, data: Any) -> str:
         pass
@@ -12,75 +18,58 @@ class DataProcessor(ABC):
         pass
 
     def format_output(self, result: str) -> str:
-        return (f"Result: {result}")
+        return (self._PREFIX + result)
 
 
 class NumericProcessor(DataProcessor):
+    _PREFIX = "Output: "
+
     def process(self, data: List[int]) -> str:
-        try:
-            length = len(data)
-            addition = sum(data)
-            return (f"Processed {length} numeric values, sum={addition}, \
-avg={addition / length}")
-        except TypeError:
+        if (not isinstance(data, list) or not all(
+                isinstance(x, (int, float)) for x in data)):
             return (f"ERROR: {data} is not the right for this processor \
 (need List[int])")
-        except ZeroDivisionError:
+        if (not data):
             return ("ERROR: data est vide")
+        length = len(data)
+        addition = sum(data)
+        return (f"Processed {length} numeric values, sum={addition}, \
+avg={addition / length}")
 
     def validate(self, data: List[int]) -> bool:
-        try:
-            length = len(data)
-            sum(data)
-            if (length > 0):
-                return (True)
-            return (False)
-        except TypeError:
+        if (not isinstance(data, list) or len(data) == 0):
             return (False)
-
-    def format_output(self, result: str) -> str:
-        return (f"Output: {result}")
+        return (all(isinstance(x, (int, float)) for x in data))
 
 
 class TextProcessor(DataProcessor):
+    _PREFIX = "Output: "
+
     def process(self, data: str) -> str:
-        if (type(data) is str):
-            return (f"Processed text: {len(data)} characters, \
-{len(data.split())} words")
-        else:
+        if (not isinstance(data, str)):
             return (f"ERROR: {data} is not the right for this processor \
 (need str)")
+        words = sum(1 for _ in _WORD_RE.finditer(data))
+        return (f"Processed text: {len(data)} characters, \
+{words} words")
 
     def validate(self, data: str) -> bool:
-        if (type(data) is str):
-            return (True)
-        return (False)
-
-    def format_output(self, result: str) -> str:
-        return (f"Output: {result}")
+        return (isinstance(data, str))
 
 
 class LogProcessor(DataProcessor):
+    _PREFIX = "Output: "
+
     def process(self, data: str) -> str:
-        alert = data.split(":")
-        if (alert[0] == "ERROR"):
-            level = "ALERT"
-        elif (alert[0] == "INFO"):
-            level = "INFO"
-        else:
-            level = "WARN"
-        return (f"[{level}] {alert[0]} level detected:{alert[1]}")
+        head, sep, tail = data.partition(":")
+        level = _LEVELS.get(head, "WARN")
+        return (f"[{level}] {head} level detected:{tail}")
 
     def validate(self, data: str) -> bool:
-        if (type(data) is not str):
+        if (not isinstance(data, str)):
             return (False)
-        alert = data.split(":")
-        if (len(alert) != 2):
-            return (False)
-        return (True)
-
-    def format_output(self, result: str) -> str:
-        return (f"Output: {result}")
+        head, sep, tail = data.partition(":")
+        return (sep == ":" and ":" not in tail)
 
 
 if (__name__ == "__main__"):
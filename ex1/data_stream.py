@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from collections import Counter
+from functools import partial
+from itertools import filterfalse
+from operator import eq, itemgetter
 from typing import Any, List, Dict, Union, Optional
 
 
@@ -19,7 +23,7 @@ class DataStream(ABC):
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        return ([data for data in data_batch if data != criteria])
+        return (list(filterfalse(partial(eq, criteria), data_batch)))
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         return ({
@@ -31,88 +35,108 @@ class SensorStream(DataStream):
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.type = "Environmental Data"
+        self._temps: List[float] = []
+        self._hums: List[float] = []
+        self._press: List[float] = []
+        self._stats: Dict[str, Union[str, int, float]] = {"count": 0}
 
     def process_batch(self, data_batch: List[Any]) -> str:
         self.data = data_batch
+        self._temps = []
+        self._hums = []
+        self._press = []
+        route = {
+            "temp": self._temps.append,
+            "humidity": self._hums.append,
+            "pressure": self._press.append
+        }.get
+        for key, value in data_batch:
+            append = route(key)
+            if (append is not None):
+                append(value)
+        self._stats = {
+            "count": len(data_batch),
+            "temp_avg": self.__avg(self._temps),
+            "hum_avg": self.__avg(self._hums),
+            "pres_avg": self.__avg(self._press)
+        }
         return (f"{len(data_batch)} readings processed")
 
+    @staticmethod
+    def __avg(values: List[float]) -> float:
+        if (not values):
+            return (0)
+        return (sum(values) / len(values))
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        temp_avg: List[int] = [0, 0]
-        hum_avg: List[int] = [0, 0]
-        pres_avg: List[int] = [0, 0]
-        for data in self.data:
-            if (data[0] == "temp"):
-                temp_avg[0] += data[1]
-                temp_avg[1] += 1
-            elif (data[0] == "humidity"):
-                hum_avg[0] += data[1]
-                hum_avg[1] += 1
-            elif (data[0] == "pressure"):
-                pres_avg[0] += data[1]
-                pres_avg[1] += 1
-        temp = temp_avg[0] / temp_avg[1]
-        hum = hum_avg[0] / hum_avg[1]
-        pres = pres_avg[0] / pres_avg[1]
-        return ({
-            "count": len(self.data),
-            "temp_avg": temp,
-            "hum_avg": hum,
-            "pres_avg": pres
-        })
+        return (self._stats)
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        return ([data for data in data_batch if data[1] >= criteria])
+        value = itemgetter(1)
+        return ([data for data in data_batch if value(data) >= criteria])
 
 
 class TransactionStream(DataStream):
+    _SIGNS = {"buy": 1, "sell": -1}
+
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.type = "Financial Data"
+        self._stats: Dict[str, Union[str, int, float]] = {
+            "count": 0,
+            "profit": 0
+        }
 
     def process_batch(self, data_batch: List[Any]) -> str:
         self.data = data_batch
+        signs = self._SIGNS
+        profit = sum(signs.get(key, 0) * value for key, value in data_batch)
+        self._stats = {
+            "count": len(data_batch),
+            "profit": profit
+        }
         return (f"{len(data_batch)} operations processed")
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        profit = 0
-        for data in self.data:
-            if (data[0] == "buy"):
-                profit += data[1]
-            elif (data[0] == "sell"):
-                profit -= data[1]
-        return ({
-            "count": len(self.data),
-            "profit": profit
-        })
+        return (self._stats)
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        return ([data for data in data_batch if data[1] >= criteria])
+        value = itemgetter(1)
+        return ([data for data in data_batch if value(data) >= criteria])
 
 
 class EventStream(DataStream):
     def __init__(self, stream_id: str) -> None:
         super().__init__(stream_id)
         self.type = "System Events"
+        self._stats: Dict[str, Union[str, int, float]] = {"count": 0}
 
     def process_batch(self, data_batch: List[Any]) -> str:
         self.data = data_batch
+        self._stats = dict(Counter(data_batch))
+        self._stats["count"] = len(data_batch)
         return (f"{len(data_batch)} events processed")
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        count = {}
-        for e in self.data:
-            if (count.get(e)):
-                count[e] += 1
-            else:
-                count[e] = 1
-        count["count"] = len(self.data)
-        return (count)
+        return (self._stats)
 
     def filter_data(self, data_batch: List[Any],
                     criteria: Optional[str] = None) -> List[Any]:
-        return ([data for data in data_batch if data == criteria])
+        return (list(filter(partial(eq, criteria), data_batch)))
+
+
+_CRITERIA = {
+    SensorStream: 20,
+    TransactionStream: 500,
+    EventStream: "error"
+}
+_BUCKETS = {
+    SensorStream: "sensor",
+    TransactionStream: "transaction",
+    EventStream: "event"
+}
 
 
 class StreamProcessor:
@@ -122,16 +146,16 @@ class StreamProcessor:
     def add_stream(self, stream: DataStream) -> None:
         self.__streams.append(stream)
 
-    def filter(self) -> List[Any]:
-        ret = []
+    def filter(self) -> Dict[str, List[Any]]:
+        ret: Dict[str, List[Any]] = {
+            "sensor": [],
+            "transaction": [],
+            "event": []
+        }
         for stream in self.__streams:
-            if (isinstance(stream, SensorStream)):
-                criteria = 20
-            elif (isinstance(stream, TransactionStream)):
-                criteria = 500
-            elif (isinstance(stream, EventStream)):
-                criteria = "error"
-            ret += stream.filter_data(stream.get_data(), criteria)
+            kind = type(stream)
+            ret[_BUCKETS[kind]].extend(stream.filter_data(
+                stream.get_data(), _CRITERIA[kind]))
         return (ret)
 
 
@@ -189,11 +213,7 @@ net flow: {stream.get_stats()['profit']:+} units")
     print("- Event data:", stream.process_batch(["error", "logout", "warn"]))
     proc.add_stream(stream)
     print("\nStream filtering active: High-priority data only")
-    filter = proc.filter()
-    sensor = [f for f in filter if len(
-        f) == 2 and f[0] != "buy" and f[0] != "sell"]
-    transaction = [f for f in filter if len(
-        f) == 2 and (f[0] == "buy" or f[0] == "sell")]
-    print(f"Filtered results: {len(sensor)} critical sensor alerts, \
-{len(transaction)} large transaction")
+    filtered = proc.filter()
+    print(f"Filtered results: {len(filtered['sensor'])} critical sensor \
+alerts, {len(filtered['transaction'])} large transaction")
     print("\nAll streams processed successfully. Nexus throughput optimal.")
@@ -1,6 +1,14 @@
+import csv
+import io
+import os
+import queue
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Dict, Protocol
 
+_STOP = object()
+
 
 class ProcessingStage(Protocol):
     def process(self, data: Any) -> Any:
@@ -8,37 +16,45 @@ class ProcessingStage(Protocol):
 
 
 class InputStage:
-    def process(self, data: Any) -> Dict:
-        print("Input: ", end="")
-        out: Dict = {
-            "raw": data
-        }
-        if (isinstance(data, dict)):
-            out["payload"] = data
-            out["type"] = "json"
-            print(data)
-            return (out)
-        if (isinstance(data, list)):
-            out["payload"] = data
-            out["type"] = "stream"
-            print("Real-time sensor stream")
-            return (out)
-        if (not isinstance(data, str)):
-            out["type"] = "invalid"
-            return (out)
-        if (data != "" and data[0] == '{' and data[-1] == '}'):
+    def _from_dict(self, out: Dict, data: Any) -> Dict:
+        out["payload"] = data
+        out["type"] = "json"
+        print(data)
+        return (out)
+
+    def _from_list(self, out: Dict, data: Any) -> Dict:
+        out["payload"] = data
+        out["type"] = "stream"
+        print("Real-time sensor stream")
+        return (out)
+
+    def _from_str(self, out: Dict, data: Any) -> Dict:
+        if (data.startswith('{') and data.endswith('}')):
             out["type"] = "json"
             out["payload"] = data
             print(data)
             return (out)
-        if (isinstance(data, str) and ',' in data):
+        if (',' in data):
             out["type"] = "csv"
             out["payload"] = data
             print(f"\"{data}\"")
             return (out)
+        return (self._invalid(out, data))
+
+    def _invalid(self, out: Dict, data: Any) -> Dict:
         out["type"] = "invalid"
         return (out)
 
+    _DISPATCH = {dict: _from_dict, list: _from_list, str: _from_str}
+
+    def process(self, data: Any) -> Dict:
+        print("Input: ", end="")
+        out: Dict = {
+            "raw": data
+        }
+        handler = self._DISPATCH.get(type(data), InputStage._invalid)
+        return (handler(self, out, data))
+
 
 class TransformStage:
     def process(self, data: Any) -> Dict:
@@ -47,16 +63,12 @@ class TransformStage:
             raise ValueError
         elif (data["type"] == "csv"):
             print("Parsed and structured data")
-            data["payload"] = data["payload"].split("\n")
-            data["payload"] = [row.split(",") for row in data["payload"]]
+            data["payload"] = list(csv.reader(io.StringIO(data["payload"])))
             data["size"] = len(data["payload"])
         elif (data["type"] == "json"):
             print("Enriched with metadata and validation")
-            data["size"] = 0
             if (isinstance(data["payload"], str)):
-                for i in data["payload"]:
-                    if (i == ':'):
-                        data["size"] += 1
+                data["size"] = data["payload"].count(":")
             else:
                 data["size"] = len(data["payload"])
         elif (data["type"] == "stream"):
@@ -79,11 +91,11 @@ reading processed")
         if (data["type"] == "csv"):
             return (f"User activity logged: {data['size']} actions processed")
         if (data["type"] == "stream"):
-            temps = [i["value"] for i in data["payload"]]
-            if not temps:
+            if (not data["payload"]):
                 return (f"Stream summary: {data['size']} readings")
+            total = sum(i["value"] for i in data["payload"])
             return (f"Stream summary: {data['size']} readings, avg: \
-{sum(temps)/data['size']}°{data['payload'][0]['unit']}")
+{total / data['size']}°{data['payload'][0]['unit']}")
 
 
 class ProcessingPipeline(ABC):
@@ -126,18 +138,42 @@ class CSVAdapter(ProcessingPipeline):
 
 
 class StreamAdapter(ProcessingPipeline):
+    _CHUNK_THRESHOLD = 1024
+
     def __init__(self, pipeline_id: int) -> None:
         super().__init__(pipeline_id)
 
+    def _run_stages(self, data: Any) -> Any:
+        for s in self.stages:
+            data = s.process(data)
+        return (data)
+
+    @staticmethod
+    def _merge(envelopes: List[Dict]) -> Dict:
+        merged = dict(envelopes[0])
+        merged["raw"] = [item for e in envelopes for item in e["raw"]]
+        merged["payload"] = [item for e in envelopes
+                             for item in e["payload"]]
+        if ("size" in merged):
+            merged["size"] = sum(e["size"] for e in envelopes)
+        return (merged)
+
     def process(self, data: Any) -> Any:
         if (not isinstance(data, list)):
             return (f"{data} is not a stream-like format")
         for i in data:
             if (not isinstance(i, dict)):
                 return (f"{data} is not a stream-like format")
-        for s in self.stages:
-            data = s.process(data)
-        return (data)
+        workers = os.cpu_count() or 1
+        if (len(data) < self._CHUNK_THRESHOLD or workers < 2
+                or len(self.stages) < 2):
+            return (self._run_stages(data))
+        size = -(-len(data) // workers)
+        chunks: Any = [data[i:i + size] for i in range(0, len(data), size)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for s in self.stages[:-1]:
+                chunks = list(executor.map(s.process, chunks))
+        return (self.stages[-1].process(self._merge(chunks)))
 
 
 class NexusManager():
@@ -148,9 +184,50 @@ class NexusManager():
         self.pipelines.append(pipeline)
 
     def process_data(self, data: Any) -> Any:
-        for i in self.pipelines:
-            data = i.process(data)
-        return (data)
+        return (self.process_batch([data])[0])
+
+    def process_batch(self, batch: List[Any]) -> List[Any]:
+        if (not self.pipelines):
+            return (list(batch))
+        queues = [queue.Queue() for _ in range(len(self.pipelines) + 1)]
+        threads = [
+            threading.Thread(target=self._worker,
+                             args=(pipeline, queues[i], queues[i + 1]))
+            for i, pipeline in enumerate(self.pipelines)
+        ]
+        for thread in threads:
+            thread.start()
+        for item in batch:
+            queues[0].put(item)
+        queues[0].put(_STOP)
+        results = []
+        while (True):
+            item = queues[-1].get()
+            if (item is _STOP):
+                break
+            results.append(item)
+        for thread in threads:
+            thread.join()
+        for item in results:
+            if (isinstance(item, Exception)):
+                raise item
+        return (results)
+
+    @staticmethod
+    def _worker(pipeline: ProcessingPipeline,
+                in_q: "queue.Queue", out_q: "queue.Queue") -> None:
+        while (True):
+            item = in_q.get()
+            if (item is _STOP):
+                out_q.put(_STOP)
+                return
+            if (isinstance(item, Exception)):
+                out_q.put(item)
+                continue
+            try:
+                out_q.put(pipeline.process(item))
+            except Exception as error:
+                out_q.put(error)
 
 
 if (__name__ == "__main__"):